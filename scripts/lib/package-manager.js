@@ -78,12 +78,34 @@ function loadConfig() {
   return null;
 }
 
+/**
+ * Write a JSON config atomically: write to a temp file, then rename over the
+ * target so readers never see a half-written config
+ */
+function writeConfigAtomic(configPath, config) {
+  const tempPath = configPath + '.tmp';
+  writeFile(tempPath, JSON.stringify(config, null, 2));
+  try {
+    // On Windows, rename fails with EEXIST if destination exists, so delete first
+    if (process.platform === 'win32' && fs.existsSync(configPath)) {
+      fs.unlinkSync(configPath);
+    }
+    fs.renameSync(tempPath, configPath);
+  } catch (err) {
+    try {
+      fs.unlinkSync(tempPath);
+    } catch {
+      // Non-critical: temp file will be overwritten on next save
+    }
+    throw err;
+  }
+}
+
 /**
  * Save package manager configuration
  */
 function saveConfig(config) {
-  const configPath = getConfigPath();
-  writeFile(configPath, JSON.stringify(config, null, 2));
+  writeConfigAtomic(getConfigPath(), config);
 }
 
 /**
@@ -273,7 +295,7 @@ function setProjectPackageManager(pmName, projectDir = process.cwd()) {
   };
 
   try {
-    writeFile(configPath, JSON.stringify(config, null, 2));
+    writeConfigAtomic(configPath, config);
   } catch (err) {
     throw new Error(`Failed to save package manager config to ${configPath}: ${err.message}`);
   }
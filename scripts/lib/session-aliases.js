@@ -102,9 +102,15 @@ function saveAliases(aliases) {
     // Ensure directory exists
     ensureDir(path.dirname(aliasesPath));
 
-    // Create backup if file exists
+    // Create backup if file exists. A hardlink is enough because the rename
+    // below gives aliasesPath a new inode, leaving the backup untouched.
+    // Fall back to copying for a stale backup or filesystems without links.
     if (fs.existsSync(aliasesPath)) {
-      fs.copyFileSync(aliasesPath, backupPath);
+      try {
+        fs.linkSync(aliasesPath, backupPath);
+      } catch {
+        fs.copyFileSync(aliasesPath, backupPath);
+      }
     }
 
     // Atomic write: write to temp file, then rename
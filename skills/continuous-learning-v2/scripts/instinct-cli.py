@@ -10,11 +10,9 @@ Commands:
 """
 
 import argparse
-import json
 import os
 import sys
 import re
-import urllib.request
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
@@ -30,6 +28,7 @@ PERSONAL_DIR = INSTINCTS_DIR / "personal"
 INHERITED_DIR = INSTINCTS_DIR / "inherited"
 EVOLVED_DIR = HOMUNCULUS_DIR / "evolved"
 OBSERVATIONS_FILE = HOMUNCULUS_DIR / "observations.jsonl"
+INSTINCT_EXTENSIONS = (".yaml", ".yml", ".md")
 
 # Ensure directories exist
 for d in [PERSONAL_DIR, INHERITED_DIR, EVOLVED_DIR / "skills", EVOLVED_DIR / "commands", EVOLVED_DIR / "agents"]:
@@ -86,13 +85,15 @@ def load_all_instincts() -> list[dict]:
     instincts = []
 
     for directory in [PERSONAL_DIR, INHERITED_DIR]:
-        if not directory.exists():
+        # Single directory scan instead of one glob per extension
+        try:
+            with os.scandir(directory) as entries:
+                yaml_files = sorted(
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith(INSTINCT_EXTENSIONS) and entry.is_file()
+                )
+        except FileNotFoundError:
             continue
-        yaml_files = sorted(
-            set(directory.glob("*.yaml"))
-            | set(directory.glob("*.yml"))
-            | set(directory.glob("*.md"))
-        )
         for file in yaml_files:
             try:
                 content = file.read_text()
@@ -185,6 +186,8 @@ def cmd_import(args):
     # Fetch content
     if source.startswith('http://') or source.startswith('https://'):
         print(f"Fetching from URL: {source}")
+        # Imported lazily: urllib pulls in http/ssl/email, only needed here
+        import urllib.request
         try:
             with urllib.request.urlopen(source) as response:
                 content = response.read().decode('utf-8')
@@ -193,10 +196,11 @@ def cmd_import(args):
             return 1
     else:
         path = Path(source).expanduser()
-        if not path.exists():
+        try:
+            content = path.read_text()
+        except (FileNotFoundError, IsADirectoryError):
             print(f"File not found: {path}", file=sys.stderr)
             return 1
-        content = path.read_text()
 
     # Parse instincts
     new_instincts = parse_instinct_file(content)
@@ -80,3 +80,17 @@ domain: general
     result = parse_instinct_file(content)
     assert len(result) == 1
     assert result[0]["content"] == ""
+
+
+def test_load_all_instincts_filters_extensions(tmp_path, monkeypatch):
+    personal = tmp_path / "personal"
+    personal.mkdir()
+    monkeypatch.setattr(_mod, "PERSONAL_DIR", personal)
+    monkeypatch.setattr(_mod, "INHERITED_DIR", tmp_path / "missing")
+    for name in ["b.yml", "a.yaml", "c.md", "notes.txt"]:
+        (personal / name).write_text(f"---\nid: {name}\n---\n")
+    (personal / "dir.yaml").mkdir()
+
+    result = _mod.load_all_instincts()
+    assert [i["id"] for i in result] == ["a.yaml", "b.yml", "c.md"]
+    assert all(i["_source_type"] == "personal" for i in result)
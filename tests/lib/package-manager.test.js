@@ -373,6 +373,21 @@ function runTests() {
   })) passed++;
   else failed++;
 
+  if (test('overwrites project config atomically without leaving temp file', () => {
+    const testDir = createTestDir();
+    try {
+      pm.setProjectPackageManager('pnpm', testDir);
+      pm.setProjectPackageManager('yarn', testDir);
+      const configPath = path.join(testDir, '.claude', 'package-manager.json');
+      const saved = JSON.parse(fs.readFileSync(configPath, 'utf8'));
+      assert.strictEqual(saved.packageManager, 'yarn');
+      assert.ok(!fs.existsSync(configPath + '.tmp'), 'Temp file should be renamed away');
+    } finally {
+      cleanupTestDir(testDir);
+    }
+  })) passed++;
+  else failed++;
+
   if (test('rejects unknown package manager', () => {
     assert.throws(() => {
       pm.setProjectPackageManager('cargo');
@@ -1821,6 +1821,25 @@ function runTests() {
       'Object.keys includes normal alias');
   })) passed++; else failed++;
 
+  // ── Round 126: saveAliases with stale backup — hardlink EEXIST falls back to copy ──
+  console.log('\nRound 126: saveAliases (stale .bak — link fails, copy fallback succeeds):');
+
+  if (test('saveAliases succeeds and removes backup when a stale .bak exists', () => {
+    resetAliases();
+    const aliasesPath = aliases.getAliasesPath();
+    const backupPath = aliasesPath + '.bak';
+    aliases.setAlias('before', '/sessions/before');
+    fs.writeFileSync(backupPath, 'stale');
+
+    const result = aliases.setAlias('after', '/sessions/after');
+    assert.strictEqual(result.success, true, 'Save should succeed despite stale backup');
+    assert.ok(!fs.existsSync(backupPath), 'Backup should be removed after successful save');
+
+    const data = aliases.loadAliases();
+    assert.ok(data.aliases.before, 'Existing alias should be preserved');
+    assert.ok(data.aliases.after, 'New alias should be saved');
+  })) passed++; else failed++;
+
   // Summary
   console.log(`\nResults: Passed: ${passed}, Failed: ${failed}`);
   process.exit(failed > 0 ? 1 : 0);